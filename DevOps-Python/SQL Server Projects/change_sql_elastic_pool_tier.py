@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import argparse
+import bisect
+import functools
+import gzip
+import json
 import os
 import re
 import sys
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Tuple
 
-from azure.core.exceptions import HttpResponseError
-from azure.identity import AzureCliCredential, DefaultAzureCredential, ChainedTokenCredential
-from azure.mgmt.sql import SqlManagementClient
-from azure.mgmt.sql.models import ElasticPoolPerDatabaseSettings, ElasticPoolUpdate, Sku
+# Azure SDK modules are imported inside functions so --help and argument errors exit
+# without loading the SDK. Creating the client loads the whole azure.mgmt.sql model
+# package (its operations import models), so every other path pays that cost.
+if TYPE_CHECKING:
+    from azure.mgmt.sql import SqlManagementClient
 
 
 # DTU tiers -> SKU names (DTU elastic pools)
@@ -25,6 +35,16 @@ DTU_TIER_CANON = {
     "premium": "Premium",
 }
 
+# Local cache for capabilities responses (static per region; shared across runs)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "az-elastic-pool")
+DEFAULT_CAPS_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# SDK default for long-running operations is 30s, which overshoots most pool updates
+DEFAULT_POLLING_INTERVAL = 5  # seconds
+
+# In-process memo: (subscription_id, location) -> capabilities dict
+_CAPS_MEMO: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
 
 # ----------------------------
 # Auth
@@ -34,6 +54,8 @@ def get_credential(prefer_az_cli: bool):
     - prefer_az_cli=True: use Azure CLI token first (good for AzureCLI@2 tasks)
     - otherwise: use DefaultAzureCredential first (good for service principal / federated creds in CI)
     """
+    from azure.identity import AzureCliCredential, ChainedTokenCredential, DefaultAzureCredential
+
     cli = AzureCliCredential()
     dac = DefaultAzureCredential(exclude_managed_identity_credential=True)
 
@@ -42,6 +64,27 @@ def get_credential(prefer_az_cli: bool):
     return ChainedTokenCredential(dac, cli)
 
 
+@functools.lru_cache(maxsize=4)
+def get_client(subscription_id: str, prefer_az_cli: bool) -> SqlManagementClient:
+    """
+    One client per (subscription, auth mode) for the whole process, so --batch runs
+    reuse pooled HTTPS connections to management.azure.com instead of re-handshaking per pool.
+    Retries stay with the SDK's own RetryPolicy.
+    """
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+    from azure.mgmt.sql import SqlManagementClient
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+    return SqlManagementClient(
+        credential=get_credential(prefer_az_cli),
+        subscription_id=subscription_id,
+        transport=RequestsTransport(session=session),
+    )
+
+
 # ----------------------------
 # Generic helpers (object/dict safe)
 # ----------------------------
@@ -49,6 +92,10 @@ def normalize(s: str) -> str:
     return str(s).strip().lower()
 
 
+def safe_lower(x: Any) -> str:
+    return str(x).lower() if x is not None else ""
+
+
 def as_list(x: Any) -> List[Any]:
     if x is None:
         return []
@@ -72,7 +119,9 @@ def get_any(obj: Any, *names: str, default=None):
     if obj is None:
         return default
 
-    # Direct attribute / dict access
+    # Direct attribute / dict access.
+    # Kept as a plain loop: the hot path is the capabilities dicts, where this beats
+    # cached attrgetters; SDK model reads are only ~15 per run.
     for n in names:
         if hasattr(obj, n):
             v = getattr(obj, n)
@@ -143,20 +192,97 @@ def parse_size_to_bytes(s: str) -> int:
     return val * mult
 
 
+@functools.lru_cache(maxsize=256)
 def bytes_to_human(b: Optional[int]) -> str:
     if b is None:
         return "-"
-    gb = b / (1024**3)
-    if gb >= 1024:
-        return f"{gb/1024:.1f}TB"
-    return f"{gb:.1f}GB"
+    # bit_length() > 40 <=> b >= 1TB (1024^4)
+    if b.bit_length() > 40:
+        return f"{b / (1 << 40):.1f}TB"
+    return f"{b / (1 << 30):.1f}GB"
 
 
 # ----------------------------
 # Capabilities parsing (robust)
 # ----------------------------
-def get_location_caps(client: SqlManagementClient, location: str):
-    return client.capabilities.list_by_location(location, include="supportedElasticPoolEditions")
+def _caps_cache_path(subscription_id: str, location: str) -> str:
+    return os.path.join(CACHE_DIR, f"caps-{subscription_id}-{normalize(location)}.json.gz")
+
+
+def _read_caps_cache(path: str, ttl: int) -> Optional[Dict[str, Any]]:
+    if ttl <= 0:
+        return None
+    try:
+        if time.time() - os.stat(path).st_mtime > ttl:
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            caps = json.load(f)
+    except (OSError, EOFError, ValueError):
+        # Missing/truncated/corrupt cache is just a miss (refetched and overwritten)
+        return None
+    return caps if isinstance(caps, dict) else None
+
+
+def _write_caps_cache(path: str, caps: Dict[str, Any]) -> None:
+    """
+    Best-effort atomic write (tmp file + os.replace) so concurrent runs never see a partial file.
+    """
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        try:
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                json.dump(caps, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def invalidate_location_caps(subscription_id: str, location: str) -> None:
+    _CAPS_MEMO.pop((subscription_id, normalize(location)), None)
+    try:
+        os.remove(_caps_cache_path(subscription_id, location))
+    except OSError:
+        pass
+
+
+def get_location_caps(
+    client: SqlManagementClient, location: str, cache_ttl: int = DEFAULT_CAPS_CACHE_TTL
+) -> Dict[str, Any]:
+    """
+    Returns the region's elastic pool capabilities as a plain dict.
+    Lookup order: in-process memo -> on-disk cache (cache_ttl seconds, 0 disables) -> capabilities API.
+    Only the elastic pool editions group is requested, which keeps the payload small.
+    """
+    from azure.core.exceptions import HttpResponseError
+    from azure.mgmt.sql.models import CapabilityGroup
+
+    subscription_id = client._config.subscription_id
+    key = (subscription_id, normalize(location))
+    if key in _CAPS_MEMO:
+        return _CAPS_MEMO[key]
+
+    path = _caps_cache_path(subscription_id, location)
+    caps = _read_caps_cache(path, cache_ttl)
+    if caps is None:
+        try:
+            resp = client.capabilities.list_by_location(
+                location, include=CapabilityGroup.SUPPORTED_ELASTIC_POOL_EDITIONS
+            )
+        except HttpResponseError as e:
+            if e.status_code in (404, 409):
+                invalidate_location_caps(subscription_id, location)
+            raise
+        caps = resp.as_dict()
+        if cache_ttl > 0:
+            _write_caps_cache(path, caps)
+
+    _CAPS_MEMO[key] = caps
+    return caps
 
 
 def iter_supported_elastic_pool_editions(caps: Any) -> Iterable[Any]:
@@ -262,26 +388,32 @@ def get_perf_level_dtu(perf: Any) -> Optional[int]:
     return to_int(val, None)
 
 
-def get_db_max_limits(perf: Any) -> List[float]:
-    caps = get_any(
-        perf,
-        "supported_per_database_max_performance_levels",
-        "supportedPerDatabaseMaxPerformanceLevels",
-        default=None,
-    )
-    out: List[float] = []
-    for c in as_list(caps):
-        lim = get_any(c, "limit", default=None)
-        f = to_float(lim, None)
-        if f is not None:
-            out.append(f)
-    return sorted(set(out))
+# Per-DB min levels when a max level doesn't list any (safe default for DTU pools)
+DEFAULT_DB_MIN_LIMITS: Tuple[Tuple[float, ...], FrozenSet[float]] = ((0.0,), frozenset((0.0,)))
+
+
+@dataclass(slots=True)
+class PerfIndex:
+    """
+    Flattened view of one elastic pool performance level, built in a single walk so
+    validation in main() never goes back to the nested capability objects.
+    """
+
+    dtu: Optional[int]
+    max_limits_sorted: Tuple[float, ...]
+    max_limits_set: FrozenSet[float]
+    # per-db max limit -> (sorted min limits, set of min limits)
+    min_by_max: Dict[float, Tuple[Tuple[float, ...], FrozenSet[float]]]
+    pool_max_bytes: Optional[int]
 
+    def min_limits_for_max(self, db_max: float) -> Tuple[Tuple[float, ...], FrozenSet[float]]:
+        return self.min_by_max.get(db_max, DEFAULT_DB_MIN_LIMITS)
 
-def get_db_min_limits_for_max(perf: Any, chosen_db_max: float) -> List[float]:
+
+def _build_perf_index(perf: Any) -> PerfIndex:
     """
-    Many capability shapes store min-levels nested under each max-level capability.
-    If we can't find it, we assume [0.0] as a safe default for DTU pools.
+    Many capability shapes store min-levels nested under each max-level capability;
+    they are collected in the same pass as the max-levels.
     """
     max_caps = get_any(
         perf,
@@ -290,48 +422,49 @@ def get_db_min_limits_for_max(perf: Any, chosen_db_max: float) -> List[float]:
         default=None,
     )
 
-    best = None
-    best_diff = None
+    min_by_max: Dict[float, Tuple[Tuple[float, ...], FrozenSet[float]]] = {}
     for c in as_list(max_caps):
         lim = to_float(get_any(c, "limit", default=None), None)
-        if lim is None:
+        if lim is None or lim in min_by_max:
             continue
-        diff = abs(lim - chosen_db_max)
-        if best is None or best_diff is None or diff < best_diff:
-            best = c
-            best_diff = diff
-
-    if best is None:
-        return [0.0]
-
-    mins = get_any(
-        best,
-        "supported_per_database_min_performance_levels",
-        "supportedPerDatabaseMinPerformanceLevels",
-        default=None,
-    )
-    out: List[float] = []
-    for m in as_list(mins):
-        lim = to_float(get_any(m, "limit", default=None), None)
-        if lim is not None:
-            out.append(lim)
-
-    return sorted(set(out)) if out else [0.0]
 
+        mins = get_any(
+            c,
+            "supported_per_database_min_performance_levels",
+            "supportedPerDatabaseMinPerformanceLevels",
+            default=None,
+        )
+        min_set = frozenset(
+            f for f in (to_float(get_any(m, "limit", default=None), None) for m in as_list(mins)) if f is not None
+        )
+        min_by_max[lim] = (tuple(sorted(min_set)), min_set) if min_set else DEFAULT_DB_MIN_LIMITS
+
+    return PerfIndex(
+        dtu=get_perf_level_dtu(perf),
+        max_limits_sorted=tuple(sorted(min_by_max)),
+        max_limits_set=frozenset(min_by_max),
+        min_by_max=min_by_max,
+        pool_max_bytes=get_supported_pool_max_bytes(perf),
+    )
 
-def choose_closest_leq(values: List[float], want: float) -> float:
-    leq = [v for v in values if v <= want]
-    return max(leq) if leq else min(values)
 
+def choose_closest_leq(sorted_values: Sequence[float], want: float) -> float:
+    """
+    Largest value <= want, else the smallest value. sorted_values must be ascending.
+    """
+    i = bisect.bisect_right(sorted_values, want)
+    return sorted_values[i - 1] if i else sorted_values[0]
 
-def choose_closest_leq_int(values: List[int], want: int) -> int:
-    leq = [v for v in values if v <= want]
-    return max(leq) if leq else min(values)
 
+def choose_closest_leq_int(sorted_values: Sequence[int], want: int) -> int:
+    i = bisect.bisect_right(sorted_values, want)
+    return sorted_values[i - 1] if i else sorted_values[0]
 
-def list_options_for_location(client: SqlManagementClient, location: str) -> List[Dict[str, Any]]:
-    caps = get_location_caps(client, location)
 
+def list_dtu_options(caps: Any) -> List[Dict[str, Any]]:
+    """
+    Flattens a capabilities response into one row per DTU tier/performance level (no I/O).
+    """
     rows: List[Dict[str, Any]] = []
     seen = set()
 
@@ -347,14 +480,15 @@ def list_options_for_location(client: SqlManagementClient, location: str) -> Lis
         sku_name = DTU_TIER_TO_SKU_NAME[tier_n]
 
         for perf in iter_elastic_pool_perf_levels(ed):
-            dtu = get_perf_level_dtu(perf)
+            perf_index = _build_perf_index(perf)
+            dtu = perf_index.dtu
             if dtu is None:
                 continue
 
-            db_max_limits = get_db_max_limits(perf)
-            pool_max_bytes = get_supported_pool_max_bytes(perf)
+            db_max_limits = perf_index.max_limits_sorted
+            pool_max_bytes = perf_index.pool_max_bytes
 
-            key = (tier_n, int(dtu), sku_name, pool_max_bytes, tuple(db_max_limits))
+            key = (tier_n, int(dtu), sku_name, pool_max_bytes, db_max_limits)
             if key in seen:
                 continue
             seen.add(key)
@@ -366,36 +500,96 @@ def list_options_for_location(client: SqlManagementClient, location: str) -> Lis
                     "sku_name": sku_name,
                     "db_max_values": db_max_limits,
                     "pool_max_bytes": pool_max_bytes,
-                    "perf_obj": perf,
+                    "perf_index": perf_index,
                 }
             )
 
     return rows
 
 
+def list_options_for_location(
+    client: SqlManagementClient, location: str, cache_ttl: int = DEFAULT_CAPS_CACHE_TTL
+) -> List[Dict[str, Any]]:
+    return list_dtu_options(get_location_caps(client, location, cache_ttl))
+
+
+def try_list_options_for_location(
+    client: SqlManagementClient, location: str, cache_ttl: int = DEFAULT_CAPS_CACHE_TTL
+) -> Tuple[Optional[List[Dict[str, Any]]], Optional[Exception]]:
+    """
+    Returns (rows, None) on success or (None, error) if the capabilities lookup failed,
+    so callers branch on the result instead of nesting try/except.
+    """
+    try:
+        return list_options_for_location(client, location, cache_ttl), None
+    except Exception as e:
+        return None, e
+
+
+def dtus_for_tier(rows: List[Dict[str, Any]], target_tier_n: str) -> Tuple[int, ...]:
+    return tuple(sorted(set(int(r["dtu"]) for r in rows if normalize(r["tier"]) == target_tier_n)))
+
+
 def find_perf_for_tier_and_dtu(
-    client: SqlManagementClient, location: str, target_tier_n: str, want_dtu: int
-) -> Tuple[Any, List[int]]:
+    rows: List[Dict[str, Any]], target_tier_n: str, want_dtu: int
+) -> Tuple[Optional[PerfIndex], Tuple[int, ...]]:
     """
-    Returns (perf_obj, available_dtus_for_tier).
-    Raises ValueError if tier not found; KeyError if DTU not found.
+    Looks up a tier/DTU in rows from list_options_for_location (no I/O).
+    Returns (perf_index, available_dtus_for_tier):
+      - tier not found: (None, ())
+      - DTU not found:  (None, available_dtus)
     """
-    rows = list_options_for_location(client, location)
     tier_rows = [r for r in rows if normalize(r["tier"]) == target_tier_n]
-    if not tier_rows:
-        raise ValueError(f"No DTU elastic pool options found for tier '{target_tier_n}' in location '{location}'.")
+    avail_dtus = dtus_for_tier(tier_rows, target_tier_n)
+    perf_index = next((r["perf_index"] for r in tier_rows if r["dtu"] == want_dtu), None)
+    return perf_index, avail_dtus
 
-    avail_dtus = sorted(set(int(r["dtu"]) for r in tier_rows))
-    if want_dtu not in avail_dtus:
-        raise KeyError(f"DTU {want_dtu} not available for tier '{target_tier_n}'. Available: {avail_dtus}")
 
-    perf_obj = next(r["perf_obj"] for r in tier_rows if int(r["dtu"]) == want_dtu)
-    return perf_obj, avail_dtus
+class PoolState(NamedTuple):
+    """
+    Normalized pool settings; two states compare equal iff no update is needed.
+    """
+
+    sku_name: str
+    tier: str
+    capacity: int
+    db_min: float
+    db_max: float
+    max_size_bytes: int
+
+    @classmethod
+    def normalized(
+        cls,
+        sku_name: Any,
+        tier: Any,
+        capacity: Optional[int],
+        db_min: Optional[float],
+        db_max: Optional[float],
+        max_size_bytes: Optional[int],
+    ) -> PoolState:
+        return cls(
+            safe_lower(sku_name),
+            safe_lower(tier),
+            int(capacity or 0),
+            float(db_min or 0.0),
+            float(db_max or 0.0),
+            int(max_size_bytes or 0),
+        )
 
 
 # ----------------------------
 # CLI args
 # ----------------------------
+def positive_int(s: str) -> int:
+    try:
+        v = int(s)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {s!r}")
+    if v < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {v}")
+    return v
+
+
 def parse_args():
     p = argparse.ArgumentParser(
         description=(
@@ -409,7 +603,13 @@ def parse_args():
     p.add_argument("--subscription-id", default=os.getenv("AZURE_SUBSCRIPTION_ID"))
     p.add_argument("--resource-group", required=True)
     p.add_argument("--server-name", required=True, help="Logical SQL server name (not the FQDN).")
-    p.add_argument("--pool-name", required=True)
+    pools = p.add_mutually_exclusive_group(required=True)
+    pools.add_argument("--pool-name")
+    pools.add_argument(
+        "--batch",
+        action="store_true",
+        help="Read pool names from stdin (one per line, '#' comments allowed) and apply the same settings to each.",
+    )
 
     p.add_argument("--target-tier", help="Target DTU tier: Basic, Standard, Premium (case-insensitive).")
     p.add_argument("--pool-dtu", type=int, default=None, help="Target pool eDTUs. If omitted, keeps current.")
@@ -429,7 +629,24 @@ def parse_args():
     )
     p.add_argument("--dry-run", action="store_true", help="Show changes without applying.")
     p.add_argument("--no-wait", action="store_true", help="Start update but don't wait.")
+    p.add_argument(
+        "--polling-interval",
+        type=positive_int,
+        default=DEFAULT_POLLING_INTERVAL,
+        help=f"Seconds between update status polls while waiting. Default: {DEFAULT_POLLING_INTERVAL}.",
+    )
+    p.add_argument(
+        "--force-validate",
+        action="store_true",
+        help="Run capabilities validation even if the pool already matches the requested settings.",
+    )
     p.add_argument("--prefer-az-cli", action="store_true", help="Prefer Azure CLI auth context (AzureCliCredential).")
+    p.add_argument(
+        "--caps-cache-ttl",
+        type=int,
+        default=DEFAULT_CAPS_CACHE_TTL,
+        help=f"Seconds to reuse the on-disk capabilities cache in {CACHE_DIR} (0 disables). Default: 24h.",
+    )
 
     return p.parse_args()
 
@@ -437,15 +654,14 @@ def parse_args():
 # ----------------------------
 # Main
 # ----------------------------
-def main() -> int:
-    args = parse_args()
-
-    if not args.subscription_id:
-        print("ERROR: Provide --subscription-id or set AZURE_SUBSCRIPTION_ID.", file=sys.stderr)
-        return 2
-
-    cred = get_credential(prefer_az_cli=args.prefer_az_cli)
-    client = SqlManagementClient(credential=cred, subscription_id=args.subscription_id)
+def scale_pool(client: SqlManagementClient, args: argparse.Namespace, pool_max_bytes: Optional[int]) -> int:
+    """
+    Reads, validates and (unless no-op/dry-run) updates the single pool args.pool_name.
+    pool_max_bytes is the already-parsed --pool-max-size (None keeps current).
+    Returns the process exit code for that pool.
+    """
+    from azure.core.exceptions import HttpResponseError
+    from azure.mgmt.sql.models import ElasticPoolPerDatabaseSettings, ElasticPoolUpdate, Sku
 
     # Fetch pool (and location)
     try:
@@ -467,11 +683,13 @@ def main() -> int:
     cur_db_min = to_float(get_any(cur_pds, "min_capacity", "minCapacity", default=None), None)
     cur_db_max = to_float(get_any(cur_pds, "max_capacity", "maxCapacity", default=None), None)
 
-    print(f"Server: {args.server_name} (location: {location})")
-    print(f"Elastic Pool: {args.pool_name}")
-    print(f"Current SKU: name={cur_sku_name!r}, tier={cur_tier!r}, capacity={cur_cap}")
-    print(f"Current per-db: min={cur_db_min}, max={cur_db_max}")
-    print(f"Current pool max_size_bytes: {cur_max} ({bytes_to_human(cur_max)})")
+    sys.stdout.write(
+        f"Server: {args.server_name} (location: {location})\n"
+        f"Elastic Pool: {args.pool_name}\n"
+        f"Current SKU: name={cur_sku_name!r}, tier={cur_tier!r}, capacity={cur_cap}\n"
+        f"Current per-db: min={cur_db_min}, max={cur_db_max}\n"
+        f"Current pool max_size_bytes: {cur_max} ({bytes_to_human(cur_max)})\n"
+    )
 
     # Rough vCore detection
     if isinstance(cur_sku_name, str) and (
@@ -491,10 +709,9 @@ def main() -> int:
 
     # List options
     if args.list_options:
-        try:
-            rows = list_options_for_location(client, location)
-        except Exception as e:
-            print(f"ERROR: Failed to list options via capabilities API: {e}", file=sys.stderr)
+        rows, caps_fetch_error = try_list_options_for_location(client, location, args.caps_cache_ttl)
+        if caps_fetch_error is not None:
+            print(f"ERROR: Failed to list options via capabilities API: {caps_fetch_error}", file=sys.stderr)
             return 1
 
         if not rows:
@@ -526,45 +743,52 @@ def main() -> int:
     target_tier = DTU_TIER_CANON[target_tier_n]
     target_sku_name = DTU_TIER_TO_SKU_NAME[target_tier_n]
 
-    # Defaults: keep current unless overridden
-    desired_pool_dtu = args.pool_dtu if args.pool_dtu is not None else (cur_cap if cur_cap is not None else 50)
-    desired_db_min = args.db_min_dtu if args.db_min_dtu is not None else (cur_db_min if cur_db_min is not None else 0.0)
-    desired_db_max = args.db_max_dtu if args.db_max_dtu is not None else (cur_db_max if cur_db_max is not None else 5.0)
+    # Defaults: keep current unless overridden (converted once here; everything below reuses these)
+    desired_pool_dtu = int(args.pool_dtu if args.pool_dtu is not None else (cur_cap if cur_cap is not None else 50))
+    desired_db_min = float(
+        args.db_min_dtu if args.db_min_dtu is not None else (cur_db_min if cur_db_min is not None else 0.0)
+    )
+    desired_db_max = float(
+        args.db_max_dtu if args.db_max_dtu is not None else (cur_db_max if cur_db_max is not None else 5.0)
+    )
 
-    desired_pool_max_bytes = cur_max
-    if args.pool_max_size:
-        desired_pool_max_bytes = parse_size_to_bytes(args.pool_max_size)
+    desired_pool_max_bytes: Optional[int] = cur_max
+    if pool_max_bytes is not None:
+        desired_pool_max_bytes = pool_max_bytes
+
+    cur_state = PoolState.normalized(cur_sku_name, cur_tier, cur_cap, cur_db_min, cur_db_max, cur_max)
+
+    # Already at the requested settings: skip the capabilities lookup entirely
+    if not args.force_validate and cur_state == PoolState.normalized(
+        target_sku_name, target_tier, desired_pool_dtu, desired_db_min, desired_db_max, desired_pool_max_bytes
+    ):
+        print("No change needed.")
+        return 0
 
     # Capabilities-based validation/auto-adjust (optional)
-    perf = None
-    avail_dtus: List[int] = []
-    caps_error: Optional[Exception] = None
+    perf: Optional[PerfIndex] = None
+    avail_dtus: Tuple[int, ...] = ()
+    caps_error: Optional[str] = None
 
     if location:
-        try:
-            perf, avail_dtus = find_perf_for_tier_and_dtu(client, location, target_tier_n, int(desired_pool_dtu))
-        except KeyError as e:
-            if args.auto_adjust and location:
-                # Pick closest <=
-                try:
-                    # get list of dtus for tier
-                    rows = list_options_for_location(client, location)
-                    tier_dtus = sorted(set(int(r["dtu"]) for r in rows if normalize(r["tier"]) == target_tier_n))
-                    if tier_dtus:
-                        new_dtu = choose_closest_leq_int(tier_dtus, int(desired_pool_dtu))
-                        print(f"Requested DTU {desired_pool_dtu} not available for {target_tier}. Auto-adjusting -> {new_dtu}.")
-                        desired_pool_dtu = int(new_dtu)
-                        perf, avail_dtus = find_perf_for_tier_and_dtu(client, location, target_tier_n, int(desired_pool_dtu))
-                    else:
-                        raise ValueError("No DTU values found for this tier.")
-                except Exception as ee:
-                    print(f"ERROR: {ee}", file=sys.stderr)
-                    return 1
-            else:
+        rows, caps_fetch_error = try_list_options_for_location(client, location, args.caps_cache_ttl)
+        if caps_fetch_error is not None:
+            caps_error = str(caps_fetch_error)
+        else:
+            perf, avail_dtus = find_perf_for_tier_and_dtu(rows, target_tier_n, desired_pool_dtu)
+            if not avail_dtus:
+                caps_error = f"No DTU elastic pool options found for tier '{target_tier_n}' in location '{location}'."
+            elif perf is None and args.auto_adjust:
+                # Pick closest <= from the rows already fetched
+                new_dtu = choose_closest_leq_int(avail_dtus, desired_pool_dtu)
+                print(f"Requested DTU {desired_pool_dtu} not available for {target_tier}. Auto-adjusting -> {new_dtu}.")
+                desired_pool_dtu = new_dtu
+                perf, avail_dtus = find_perf_for_tier_and_dtu(rows, target_tier_n, desired_pool_dtu)
+            elif perf is None:
                 # Proceed without auto-adjust (but still allow update without perf)
-                caps_error = e
-        except Exception as e:
-            caps_error = e
+                caps_error = (
+                    f"DTU {desired_pool_dtu} not available for tier '{target_tier_n}'. Available: {list(avail_dtus)}"
+                )
 
     if caps_error and (args.auto_adjust):
         print(f"ERROR: Capabilities lookup failed; cannot auto-adjust.\n{caps_error}", file=sys.stderr)
@@ -572,13 +796,13 @@ def main() -> int:
 
     # If we have perf, validate/adjust per-db and pool size
     if perf is not None:
-        max_limits = get_db_max_limits(perf)
+        max_limits = perf.max_limits_sorted
         if max_limits:
-            if float(desired_db_max) not in max_limits:
+            if desired_db_max not in perf.max_limits_set:
                 if args.auto_adjust:
-                    new_db_max = choose_closest_leq(max_limits, float(desired_db_max))
+                    new_db_max = choose_closest_leq(max_limits, desired_db_max)
                     print(f"Requested db-max-dtu {desired_db_max} not supported. Auto-adjusting -> {new_db_max}.")
-                    desired_db_max = float(new_db_max)
+                    desired_db_max = new_db_max
                 else:
                     print(
                         f"ERROR: db-max-dtu {desired_db_max} not supported for {target_tier} {desired_pool_dtu} DTU. "
@@ -587,12 +811,12 @@ def main() -> int:
                     )
                     return 1
 
-            min_limits = get_db_min_limits_for_max(perf, float(desired_db_max))
-            if min_limits and float(desired_db_min) not in min_limits:
+            min_limits, min_limits_set = perf.min_limits_for_max(desired_db_max)
+            if min_limits and desired_db_min not in min_limits_set:
                 if args.auto_adjust:
-                    new_db_min = choose_closest_leq(min_limits, float(desired_db_min))
+                    new_db_min = choose_closest_leq(min_limits, desired_db_min)
                     print(f"Requested db-min-dtu {desired_db_min} not supported. Auto-adjusting -> {new_db_min}.")
-                    desired_db_min = float(new_db_min)
+                    desired_db_min = new_db_min
                 else:
                     print(
                         f"ERROR: db-min-dtu {desired_db_min} not supported for db-max-dtu {desired_db_max}. "
@@ -601,7 +825,7 @@ def main() -> int:
                     )
                     return 1
 
-        cap_pool_max = get_supported_pool_max_bytes(perf)
+        cap_pool_max = perf.pool_max_bytes
         if cap_pool_max is not None and desired_pool_max_bytes is not None and desired_pool_max_bytes > cap_pool_max:
             if args.auto_adjust:
                 print(
@@ -623,22 +847,16 @@ def main() -> int:
                 file=sys.stderr,
             )
 
-    print("\nTarget:")
-    print(f"  SKU: name={target_sku_name!r}, tier={target_tier!r}, capacity(DTU)={desired_pool_dtu}")
-    print(f"  per-db: min={desired_db_min}, max={desired_db_max}")
-    print(f"  pool max size: {desired_pool_max_bytes} ({bytes_to_human(desired_pool_max_bytes)})")
-
-    # No-op check
-    def safe_lower(x: Any) -> str:
-        return str(x).lower() if x is not None else ""
-
-    if (
-        safe_lower(cur_sku_name) == safe_lower(target_sku_name)
-        and safe_lower(cur_tier) == safe_lower(target_tier)
-        and int(cur_cap or 0) == int(desired_pool_dtu)
-        and float(cur_db_min or 0.0) == float(desired_db_min)
-        and float(cur_db_max or 0.0) == float(desired_db_max)
-        and int(cur_max or 0) == int(desired_pool_max_bytes or 0)
+    sys.stdout.write(
+        "\nTarget:\n"
+        f"  SKU: name={target_sku_name!r}, tier={target_tier!r}, capacity(DTU)={desired_pool_dtu}\n"
+        f"  per-db: min={desired_db_min}, max={desired_db_max}\n"
+        f"  pool max size: {desired_pool_max_bytes} ({bytes_to_human(desired_pool_max_bytes)})\n"
+    )
+
+    # No-op check (auto-adjust may have landed on the current settings)
+    if cur_state == PoolState.normalized(
+        target_sku_name, target_tier, desired_pool_dtu, desired_db_min, desired_db_max, desired_pool_max_bytes
     ):
         print("No change needed.")
         return 0
@@ -649,14 +867,14 @@ def main() -> int:
 
     # Build PATCH update
     update = ElasticPoolUpdate(
-        sku=Sku(name=target_sku_name, tier=target_tier, capacity=int(desired_pool_dtu)),
+        sku=Sku(name=target_sku_name, tier=target_tier, capacity=desired_pool_dtu),
         per_database_settings=ElasticPoolPerDatabaseSettings(
-            min_capacity=float(desired_db_min),
-            max_capacity=float(desired_db_max),
+            min_capacity=desired_db_min,
+            max_capacity=desired_db_max,
         ),
     )
     if desired_pool_max_bytes is not None:
-        update.max_size_bytes = int(desired_pool_max_bytes)
+        update.max_size_bytes = desired_pool_max_bytes
 
     # Apply
     try:
@@ -665,6 +883,7 @@ def main() -> int:
             args.server_name,
             args.pool_name,
             parameters=update,
+            polling_interval=args.polling_interval,
         )
         if args.no_wait:
             print("Update started (no-wait).")
@@ -683,19 +902,65 @@ def main() -> int:
     new_pds = get_any(updated, "per_database_settings", "perDatabaseSettings", default=None)
     new_max = to_int(get_any(updated, "max_size_bytes", "maxSizeBytes", default=None), None)
 
-    print("\nDone.")
-    print(
+    sys.stdout.write(
+        "\nDone.\n"
         f"New SKU: name={get_any(new_sku, 'name', default=None)!r}, "
         f"tier={get_any(new_sku, 'tier', default=None)!r}, "
-        f"capacity={get_any(new_sku, 'capacity', default=None)}"
-    )
-    print(
+        f"capacity={get_any(new_sku, 'capacity', default=None)}\n"
         f"New per-db: min={get_any(new_pds, 'min_capacity', 'minCapacity', default=None)}, "
-        f"max={get_any(new_pds, 'max_capacity', 'maxCapacity', default=None)}"
+        f"max={get_any(new_pds, 'max_capacity', 'maxCapacity', default=None)}\n"
+        f"New pool max_size_bytes: {new_max} ({bytes_to_human(new_max)})\n"
     )
-    print(f"New pool max_size_bytes: {new_max} ({bytes_to_human(new_max)})")
     return 0
 
 
+def read_batch_pool_names(lines: Iterable[str]) -> List[str]:
+    names = []
+    for line in lines:
+        name = line.split("#", 1)[0].strip()
+        if name:
+            names.append(name)
+    return names
+
+
+def main() -> int:
+    args = parse_args()
+
+    if not args.subscription_id:
+        print("ERROR: Provide --subscription-id or set AZURE_SUBSCRIPTION_ID.", file=sys.stderr)
+        return 2
+
+    # Parsed once here so a bad size fails fast (and only once in --batch mode)
+    pool_max_bytes: Optional[int] = None
+    if args.pool_max_size:
+        try:
+            pool_max_bytes = parse_size_to_bytes(args.pool_max_size)
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 2
+
+    if not args.batch:
+        return scale_pool(get_client(args.subscription_id, args.prefer_az_cli), args, pool_max_bytes)
+
+    pool_names = read_batch_pool_names(sys.stdin)
+    if not pool_names:
+        print("ERROR: --batch given but no pool names were read from stdin.", file=sys.stderr)
+        return 2
+
+    client = get_client(args.subscription_id, args.prefer_az_cli)
+    rc = 0
+    for i, pool_name in enumerate(pool_names):
+        if i:
+            print()
+        try:
+            pool_rc = scale_pool(client, argparse.Namespace(**{**vars(args), "pool_name": pool_name}), pool_max_bytes)
+        except Exception as e:
+            # One pool failing (e.g. a network error) must not abort the rest of the batch
+            print(f"ERROR: {pool_name}: {e}", file=sys.stderr)
+            pool_rc = 1
+        rc = max(rc, pool_rc)
+    return rc
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
\ No newline at end of file